@@ -0,0 +1,60 @@
+import asyncio
+
+import httpcore
+import httpx
+import pytest
+
+from vivacitypy import VivacityClient
+from vivacitypy.client import CONNECT_RETRIES
+
+API_URL = httpx.URL("https://api.vivacitylabs.com/countline/counts")
+PROXY_URL = "http://proxy.example:3128"
+PROXY_ENV_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+@pytest.fixture(autouse=True)
+def clear_proxy_env(monkeypatch):
+    for name in PROXY_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+
+
+def pool_for_api(**kwargs):
+    """Open a client and return the connection pool httpx would use for the API."""
+    async def run():
+        async with VivacityClient("test", api_key="key", **kwargs) as client:
+            return client.client._transport_for_url(API_URL)._pool
+
+    return asyncio.run(run())
+
+
+def test_uses_retrying_transport_without_proxy():
+    pool = pool_for_api()
+    assert not isinstance(pool, httpcore.AsyncHTTPProxy)
+    assert pool._retries == CONNECT_RETRIES
+
+
+@pytest.mark.parametrize("name", ["HTTPS_PROXY", "ALL_PROXY", "https_proxy"])
+def test_honours_proxy_env_vars(monkeypatch, name):
+    monkeypatch.setenv(name, PROXY_URL)
+    pool = pool_for_api()
+    assert isinstance(pool, httpcore.AsyncHTTPProxy)
+    assert pool._proxy_url.host == b"proxy.example"
+
+
+def test_no_proxy_bypasses_env_proxy(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", PROXY_URL)
+    monkeypatch.setenv("NO_PROXY", "api.vivacitylabs.com")
+    assert not isinstance(pool_for_api(), httpcore.AsyncHTTPProxy)
+
+
+def test_trust_env_false_ignores_proxy_env_vars(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", PROXY_URL)
+    assert not isinstance(pool_for_api(trust_env=False), httpcore.AsyncHTTPProxy)
+
+
+def test_explicit_proxy_overrides_env(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://other.example:3128")
+    pool = pool_for_api(proxy=PROXY_URL)
+    assert isinstance(pool, httpcore.AsyncHTTPProxy)
+    assert pool._proxy_url.host == b"proxy.example"
@@ -6,18 +6,88 @@ API keys are region-specific (e.g., WYCA for West Yorkshire).
 API Documentation: https://docs.vivacitylabs.com/
 """
 
+import asyncio
+import logging
+import math
 import os
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.request import getproxies
 
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
+from cachetools import TTLCache
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from .constants import VIVACITY_TO_UNIFIED
 
+logger = logging.getLogger(__name__)
+
 # Vivacity class names mapped to unified modes
 VIVACITY_CLASS_MAP = VIVACITY_TO_UNIFIED
 
+# Timestamp format used by the API for both query params and response records
+API_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Column layout of count records, with and without direction preserved
+COUNT_COLUMNS = ("countline_id", "timestamp", "from", "to", "direction", "class", "mode", "count")
+BIDIRECTIONAL_COUNT_COLUMNS = ("countline_id", "timestamp", "from", "to", "class", "mode", "count")
+
+# Arrow-backed strings keep id/label columns in one contiguous buffer instead
+# of per-value Python objects, which also speeds up hashing for groupby/merge
+ARROW_STRING = "string[pyarrow]"
+
+# Rate-limited and transient server errors worth retrying a batch for
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 5
+CONNECT_RETRIES = 3
+# Longest wait in seconds between attempts, whether from backoff or Retry-After
+MAX_RETRY_WAIT = 30.0
+
+_backoff = wait_exponential_jitter(initial=1, max=MAX_RETRY_WAIT)
+
+
+def _env_proxies_configured() -> bool:
+    """Whether HTTP_PROXY, HTTPS_PROXY or ALL_PROXY is set, as httpx reads them."""
+    return any(scheme in getproxies() for scheme in ("http", "https", "all"))
+
+
+def _parse(resp: httpx.Response):
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(resp.content)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry timeouts and rate-limit/transient server error responses."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUS_CODES
+    return isinstance(exc, httpx.TimeoutException)
+
+
+def _retry_wait(retry_state) -> float:
+    """Wait for the server's Retry-After (capped) if given, else back off exponentially."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = None  # HTTP-date form; fall back to backoff
+            if delay is not None and math.isfinite(delay):
+                # Clamp so a large Retry-After cannot stall the whole fetch
+                return min(max(delay, 0.0), MAX_RETRY_WAIT)
+    return _backoff(retry_state)
+
 
 def batch_date_range(from_date: datetime, to_date: datetime, max_days: int = 7) -> list[dict]:
     """Split a date range into batches of max_days.
@@ -33,6 +103,72 @@ def batch_date_range(from_date: datetime, to_date: datetime, max_days: int = 7)
     return batches
 
 
+def _build_counts_df(cols: dict[str, list], region_name: str, bidirectional: bool) -> pd.DataFrame:
+    """Format count columns from VivacityClient._get_count_columns for ingestion."""
+    if not cols["countline_id"]:
+        return pd.DataFrame()
+    
+    # Convert to DataFrame straight from the columns
+    cols["sensor_id"] = cols.pop("countline_id")
+    cols["count"] = np.fromiter(cols["count"], dtype=np.int32, count=len(cols["count"]))
+    df = pd.DataFrame(cols, copy=False)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, format=API_TIME_FORMAT)
+    df["region"] = region_name
+    df["source"] = "vivacity"
+    
+    string_cols = ["sensor_id", "mode", "region", "source"]
+    if not bidirectional:
+        string_cols.append("direction")
+    df = df.astype(dict.fromkeys(string_cols, ARROW_STRING))
+    
+    if bidirectional:
+         # Standard format for counterflow.daily_counts compatibility
+         df["v85"] = None
+         return df[["timestamp", "sensor_id", "mode", "count", "v85", "region", "source"]]
+    
+    # Preservation of direction for vivacity_traffic_counts
+    return df[["timestamp", "sensor_id", "direction", "mode", "count", "region", "source"]]
+
+
+def _build_counts_with_speed_df(
+    cols: dict[str, list], speed_records: list[dict], region_name: str
+) -> pd.DataFrame:
+    """Format bidirectional count columns and join daily car p85 speed as v85."""
+    df = _build_counts_df(cols, region_name, bidirectional=True)
+    if df.empty:
+        return df
+
+    if speed_records:
+        speed_df = pd.DataFrame(speed_records)
+        speed_df["date"] = pd.to_datetime(speed_df["from"], utc=True, format=API_TIME_FORMAT).dt.date
+        speed_df = speed_df.rename(columns={"countline_id": "sensor_id"})
+        # Match the counts frame so the merge joins on arrow strings
+        speed_df["sensor_id"] = speed_df["sensor_id"].astype(ARROW_STRING)
+
+        # Average speed per sensor per day
+        speed_daily = speed_df.groupby(["sensor_id", "date"]).agg({
+            "p85_speed": "mean"
+        }).reset_index()
+
+        # Add date column to main df for joining
+        df["date"] = df["timestamp"].dt.date
+
+        # Join speed to car records
+        df = df.merge(
+            speed_daily[["sensor_id", "date", "p85_speed"]],
+            on=["sensor_id", "date"],
+            how="left"
+        )
+
+        # Only apply v85 to car mode
+        df["v85"] = np.where(
+            (df["mode"] == "car").to_numpy(), df["p85_speed"].to_numpy(), df["v85"].to_numpy()
+        )
+        df = df.drop(columns=["date", "p85_speed"])
+
+    return df
+
+
 class VivacityClient:
     """Async client for the Vivacity traffic sensor API."""
 
@@ -42,6 +178,12 @@ class VivacityClient:
         api_key: Optional[str] = None,
         base_url: str = "https://api.vivacitylabs.com",
         timeout: float = 120.0,
+        max_concurrency: int = 10,
+        max_connections: int = 100,
+        max_keepalive: int = 50,
+        cache_ttl: Optional[float] = 60.0,
+        proxy: Optional[str] = None,
+        trust_env: bool = True,
     ):
         """Initialize Vivacity client for a specific region.
         
@@ -50,6 +192,17 @@ class VivacityClient:
             api_key: Optional API key override. If not provided, looks for VIVACITY_{REGION} env var.
             base_url: API base URL
             timeout: Request timeout in seconds
+            max_concurrency: Maximum number of batch requests in flight at once
+            max_connections: Maximum number of pooled HTTP connections
+            max_keepalive: Maximum number of idle keep-alive connections to retain
+            cache_ttl: Seconds to reuse an identical batch response before refetching it.
+                Caching is on by default, so results may be up to cache_ttl seconds
+                old. None or 0 disables it.
+            proxy: Optional proxy URL for all requests. Takes precedence over
+                proxy environment variables. Connection-level retries only apply
+                to direct (unproxied) connections.
+            trust_env: If True, honour HTTP_PROXY/HTTPS_PROXY/ALL_PROXY/NO_PROXY and
+                other httpx environment settings
         """
         self.region_code = region_code.lower()
         self.api_key = api_key or os.getenv(f"VIVACITY_{region_code.upper()}")
@@ -64,27 +217,192 @@ class VivacityClient:
 
         self.base_url = base_url
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.proxy = proxy
+        self.trust_env = trust_env
         self.headers = {
             "x-vivacity-api-key": self.api_key,
             "User-Agent": "VivacityPy/1.0",
         }
         self._client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        # Batch responses keyed by (url, countline ids, from, to, time_bucket)
+        self._response_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=256, ttl=cache_ttl) if cache_ttl else None
+        )
 
-    async def __aenter__(self) -> "VivacityClient":
-        self._client = httpx.AsyncClient(timeout=self.timeout, headers=self.headers)
+    async def open(self) -> "VivacityClient":
+        """Open the underlying HTTP client.
+        
+        The connection pool stays open until close() is called, so one client
+        can be reused across many workflows. Calling open() again is a no-op.
+        """
+        if self._client is None:
+            # HTTP/2 multiplexes concurrent batch requests over a single connection
+            # to the API host; the pool limits apply if the server falls back to HTTP/1.1.
+            pool_options = {
+                "http2": True,
+                "limits": httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                ),
+                "trust_env": self.trust_env,
+            }
+            if self.proxy or (self.trust_env and _env_proxies_configured()):
+                # Let httpx build its proxy transports (and honour NO_PROXY);
+                # passing transport= would make it ignore proxy env vars
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    proxy=self.proxy,
+                    **pool_options,
+                )
+            else:
+                # Direct connections retry failed connection attempts before they
+                # reach the request-level retries in _fetch_one
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    transport=httpx.AsyncHTTPTransport(
+                        retries=CONNECT_RETRIES, **pool_options
+                    ),
+                )
+            # Created here so the semaphore binds to the running event loop
+            self._sem = asyncio.Semaphore(self.max_concurrency)
         return self
 
-    async def __aexit__(self, *args) -> None:
+    async def close(self) -> None:
+        """Close the underlying HTTP client and release its connections."""
         if self._client:
             await self._client.aclose()
             self._client = None
+            self._sem = None
+        if self._response_cache is not None:
+            self._response_cache.clear()
+
+    async def __aenter__(self) -> "VivacityClient":
+        return await self.open()
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
 
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            raise RuntimeError("VivacityClient must be used as async context manager")
+            raise RuntimeError(
+                "VivacityClient must be opened with open() or used as async context manager"
+            )
         return self._client
 
+    @staticmethod
+    def _batch_params(
+        countline_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        time_bucket: str,
+    ) -> list[dict]:
+        """Build query params for every (countline batch, date batch) pair."""
+        # Vivacity API limits to 7 days per request
+        date_batches = batch_date_range(start_time, end_time, max_days=7)
+        
+        # Also batch countline_ids to avoid too long URLs and timeouts
+        id_batches = [countline_ids[i:i + 50] for i in range(0, len(countline_ids), 50)]
+        
+        return [
+            {
+                "countline_ids": ",".join(id_batch),
+                "from": date_batch["from"].strftime(API_TIME_FORMAT),
+                "to": date_batch["to"].strftime(API_TIME_FORMAT),
+                "time_bucket": time_bucket,
+            }
+            for id_batch in id_batches
+            for date_batch in date_batches
+        ]
+
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        wait=_retry_wait,
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    async def _fetch_one(self, url: str, params: dict) -> Optional[dict]:
+        """Fetch a single batch, bounded by the client's concurrency limit.
+        
+        Timeouts and RETRY_STATUS_CODES responses are retried with backoff,
+        honouring Retry-After. Returns the decoded JSON body, or None for any
+        other non-200 response. When caching is enabled, successful responses
+        are kept for cache_ttl seconds so overlapping refreshes reuse them.
+        """
+        cache = self._response_cache
+        if cache is not None:
+            key = (
+                url,
+                tuple(sorted(params["countline_ids"].split(","))),
+                params["from"],
+                params["to"],
+                params.get("time_bucket"),
+            )
+            if key in cache:
+                return cache[key]
+        
+        async with self._sem:
+            resp = await self.client.get(url, params=params)
+        
+        if resp.status_code in RETRY_STATUS_CODES:
+            resp.raise_for_status()
+        if resp.status_code != 200:
+            logger.warning(
+                "Skipping batch %s %s: HTTP %s", url, params, resp.status_code
+            )
+            return None
+        
+        data = _parse(resp)
+        
+        if cache is not None:
+            cache[key] = data
+        return data
+
+    async def _fetch_or_skip(self, url: str, params: dict, label: str) -> Optional[dict]:
+        """Fetch a batch, logging and skipping it if it still fails after retries.
+        
+        Only HTTP and JSON decode failures are skipped, so one bad batch does
+        not cancel its siblings. Anything else is a bug and propagates.
+        """
+        try:
+            return await self._fetch_one(url, params)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.warning("Error fetching %s for batch: %s", label, e)
+            return None
+
+    async def _fetch_batches(self, url: str, param_sets: list[dict], label: str) -> list[dict]:
+        """Fetch all batches concurrently and return the successful responses."""
+        if self._response_cache is not None:
+            # TTLCache only drops stale entries on write; release them up front
+            self._response_cache.expire()
+        
+        if hasattr(asyncio, "TaskGroup"):
+            # An unexpected error cancels the remaining batches
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(self._fetch_or_skip(url, params, label))
+                        for params in param_sets
+                    ]
+            except BaseExceptionGroup as eg:
+                # Surface the original error, as the gather path below does
+                raise eg.exceptions[0]
+            results = [task.result() for task in tasks]
+        else:
+            # asyncio.TaskGroup needs Python 3.11+
+            results = await asyncio.gather(
+                *(self._fetch_or_skip(url, params, label) for params in param_sets)
+            )
+        
+        return [result for result in results if result is not None]
+
     async def get_countline_metadata(self) -> list[dict]:
         """Fetch all countline metadata for this region.
         
@@ -98,7 +416,7 @@ class VivacityClient:
         resp = await self.client.get(f"{self.base_url}/countline/metadata")
         resp.raise_for_status()
         
-        data = resp.json()
+        data = _parse(resp)
         countlines = []
         
         for countline_id, item in data.items():
@@ -144,7 +462,7 @@ class VivacityClient:
         resp = await self.client.get(f"{self.base_url}/hardware/metadata")
         resp.raise_for_status()
         
-        data = resp.json()
+        data = _parse(resp)
         hardware = []
         
         for hw_id, item in data.items():
@@ -159,6 +477,90 @@ class VivacityClient:
         
         return hardware
 
+    async def _get_count_columns(
+        self,
+        countline_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        time_bucket: str = "1h",
+        bidirectional: bool = True,
+    ) -> dict[str, list]:
+        """Fetch counts as a column-oriented dict of lists.
+        
+        Same records as get_counts, but laid out column-wise so they can be
+        handed straight to pd.DataFrame without per-row dict handling.
+        """
+        param_sets = self._batch_params(countline_ids, start_time, end_time, time_bucket)
+        responses = await self._fetch_batches(
+            f"{self.base_url}/countline/counts", param_sets, "counts"
+        )
+        
+        if bidirectional:
+            # Running totals keyed by (countline_id, from, to, class, mode)
+            totals = defaultdict(int)
+        else:
+            cols = {k: [] for k in COUNT_COLUMNS}
+            (
+                append_id, append_timestamp, append_from, append_to,
+                append_direction, append_class, append_mode, append_count,
+            ) = (cols[k].append for k in COUNT_COLUMNS)
+        
+        # Bound once as locals; the loop below runs per class per direction per record
+        map_get = VIVACITY_CLASS_MAP.get
+        directions = ("clockwise", "anti_clockwise")
+        
+        for data in responses:
+            # Parse response - structure is {countline_id: [records]}
+            for countline_id, records in data.items():
+                if not records:
+                    continue
+                    
+                for record in records:
+                    from_time = record.get("from")
+                    to_time = record.get("to")
+                    
+                    # Process each direction
+                    for direction in directions:
+                        dir_data = record.get(direction)
+                        if not dir_data:
+                            continue
+                            
+                        # Extract counts by class
+                        for viv_class, count in dir_data.items():
+                            if viv_class == "total" or count is None:
+                                continue
+                                
+                            # Map to standard mode
+                            mode = map_get(viv_class, viv_class)
+                            
+                            if bidirectional:
+                                totals[(countline_id, from_time, to_time, viv_class, mode)] += count
+                                continue
+                            
+                            append_id(countline_id)
+                            append_timestamp(from_time)
+                            append_from(from_time)
+                            append_to(to_time)
+                            append_direction(direction)
+                            append_class(viv_class)
+                            append_mode(mode)
+                            append_count(count)
+        
+        if not bidirectional:
+            return cols
+        
+        cols = {k: [] for k in BIDIRECTIONAL_COUNT_COLUMNS}
+        for (countline_id, from_time, to_time, viv_class, mode), count in totals.items():
+            cols["countline_id"].append(countline_id)
+            cols["timestamp"].append(from_time)
+            cols["from"].append(from_time)
+            cols["to"].append(to_time)
+            cols["class"].append(viv_class)
+            cols["mode"].append(mode)
+            cols["count"].append(count)
+        
+        return cols
+
     async def get_counts(
         self,
         countline_ids: list[str],
@@ -180,84 +582,10 @@ class VivacityClient:
         Returns:
             List of count records.
         """
-        # Vivacity API limits to 7 days per request
-        date_batches = batch_date_range(start_time, end_time, max_days=7)
-        
-        # Also batch countline_ids to avoid too long URLs and timeouts
-        id_batches = [countline_ids[i:i + 50] for i in range(0, len(countline_ids), 50)]
-        
-        all_records = []
-        
-        for id_batch in id_batches:
-            for date_batch in date_batches:
-                params = {
-                    "countline_ids": ",".join(id_batch),
-                    "from": date_batch["from"].strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "to": date_batch["to"].strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "time_bucket": time_bucket,
-                }
-                
-                try:
-                    resp = await self.client.get(
-                        f"{self.base_url}/countline/counts",
-                        params=params
-                    )
-                    
-                    if resp.status_code != 200:
-                        continue
-                        
-                    data = resp.json()
-                    
-                    # Parse response - structure is {countline_id: [records]}
-                    for countline_id, records in data.items():
-                        if not records:
-                            continue
-                            
-                        for record in records:
-                            from_time = record.get("from")
-                            to_time = record.get("to")
-                            
-                            # Process each direction
-                            for direction in ["clockwise", "anti_clockwise"]:
-                                dir_data = record.get(direction, {})
-                                if not dir_data:
-                                    continue
-                                    
-                                # Extract counts by class
-                                for viv_class, count in dir_data.items():
-                                    if viv_class == "total" or count is None:
-                                        continue
-                                        
-                                    # Map to standard mode
-                                    mode = VIVACITY_CLASS_MAP.get(viv_class, viv_class)
-                                    
-                                    all_records.append({
-                                        "countline_id": countline_id,
-                                        "timestamp": from_time,
-                                        "from": from_time,
-                                        "to": to_time,
-                                        "direction": direction,
-                                        "class": viv_class,
-                                        "mode": mode,
-                                        "count": count,
-                                    })
-                except Exception as e:
-                    print(f"Error fetching counts for batch: {e}")
-                    continue
-        
-        if bidirectional:
-            # Aggregate to sum directions
-            df = pd.DataFrame(all_records)
-            if df.empty:
-                return []
-            
-            # Group by everything except direction and count, then sum count
-            df_agg = df.groupby(["countline_id", "timestamp", "from", "to", "class", "mode"]).agg({
-                "count": "sum"
-            }).reset_index()
-            return df_agg.to_dict(orient="records")
-            
-        return all_records
+        cols = await self._get_count_columns(
+            countline_ids, start_time, end_time, time_bucket, bidirectional=bidirectional
+        )
+        return [dict(zip(cols, row)) for row in zip(*cols.values())]
 
     async def get_speed(
         self,
@@ -277,51 +605,28 @@ class VivacityClient:
         Returns:
             List of speed records with percentile data
         """
-        # Vivacity API limits to 7 days per request
-        date_batches = batch_date_range(start_time, end_time, max_days=7)
-        
-        # Batch countline_ids
-        id_batches = [countline_ids[i:i + 50] for i in range(0, len(countline_ids), 50)]
+        param_sets = self._batch_params(countline_ids, start_time, end_time, time_bucket)
+        responses = await self._fetch_batches(
+            f"{self.base_url}/countline/speed", param_sets, "speed"
+        )
         
         all_records = []
         
-        for id_batch in id_batches:
-            for date_batch in date_batches:
-                params = {
-                    "countline_ids": ",".join(id_batch),
-                    "from": date_batch["from"].strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "to": date_batch["to"].strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "time_bucket": time_bucket,
-                }
-                
-                try:
-                    resp = await self.client.get(
-                        f"{self.base_url}/countline/speed",
-                        params=params
-                    )
-                    
-                    if resp.status_code != 200:
-                        continue
-                        
-                    data = resp.json()
-                    
-                    for countline_id, records in data.items():
-                        if not records:
-                            continue
-                            
-                        for record in records:
-                            all_records.append({
-                                "countline_id": countline_id,
-                                "from": record.get("from"),
-                                "to": record.get("to"),
-                                "mean_speed": record.get("mean"),
-                                "p50_speed": record.get("p50"),
-                                "p85_speed": record.get("p85"),
-                                "sample_size": record.get("sample_size"),
-                            })
-                except Exception as e:
-                    print(f"Error fetching speed for batch: {e}")
+        for data in responses:
+            for countline_id, records in data.items():
+                if not records:
                     continue
+                    
+                for record in records:
+                    all_records.append({
+                        "countline_id": countline_id,
+                        "from": record.get("from"),
+                        "to": record.get("to"),
+                        "mean_speed": record.get("mean"),
+                        "p50_speed": record.get("p50"),
+                        "p85_speed": record.get("p85"),
+                        "sample_size": record.get("sample_size"),
+                    })
         
         return all_records
 
@@ -348,27 +653,12 @@ class VivacityClient:
             DataFrame ready for ingestion.
         """
         # Fetch counts
-        counts = await self.get_counts(
+        cols = await self._get_count_columns(
             countline_ids, start_time, end_time, time_bucket, bidirectional=bidirectional
         )
         
-        if not counts:
-            return pd.DataFrame()
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(counts)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df = df.rename(columns={"countline_id": "sensor_id"})
-        df["region"] = region_name
-        df["source"] = "vivacity"
-        
-        if bidirectional:
-             # Standard format for counterflow.daily_counts compatibility
-             df["v85"] = None
-             return df[["timestamp", "sensor_id", "mode", "count", "v85", "region", "source"]]
-        
-        # Preservation of direction for vivacity_traffic_counts
-        return df[["timestamp", "sensor_id", "direction", "mode", "count", "region", "source"]]
+        # Run the pandas formatting off the event loop
+        return await asyncio.to_thread(_build_counts_df, cols, region_name, bidirectional)
 
     async def fetch_region_traffic_with_speed(
         self,
@@ -383,41 +673,17 @@ class VivacityClient:
         Similar to fetch_region_traffic but also fetches speed data
         and joins it to car mode records.
         """
-        # Fetch counts
-        df = await self.fetch_region_traffic(
-            countline_ids, start_time, end_time, region_name, time_bucket
+        # Fetch counts and speed data (daily aggregation for efficiency) concurrently;
+        # both share the client's concurrency limit
+        cols, speed_records = await asyncio.gather(
+            self._get_count_columns(
+                countline_ids, start_time, end_time, time_bucket, bidirectional=True
+            ),
+            self.get_speed(countline_ids, start_time, end_time, time_bucket="24h"),
         )
         
-        if df.empty:
-            return df
-        
-        # Fetch speed data (daily aggregation for efficiency)
-        speed_records = await self.get_speed(
-            countline_ids, start_time, end_time, time_bucket="24h"
+        # Formatting and the speed join are CPU-bound pandas work; run them off the
+        # event loop so other fetches sharing it keep making progress
+        return await asyncio.to_thread(
+            _build_counts_with_speed_df, cols, speed_records, region_name
         )
-        
-        if speed_records:
-            speed_df = pd.DataFrame(speed_records)
-            speed_df["date"] = pd.to_datetime(speed_df["from"]).dt.date
-            speed_df = speed_df.rename(columns={"countline_id": "sensor_id"})
-            
-            # Average speed per sensor per day
-            speed_daily = speed_df.groupby(["sensor_id", "date"]).agg({
-                "p85_speed": "mean"
-            }).reset_index()
-            
-            # Add date column to main df for joining
-            df["date"] = df["timestamp"].dt.date
-            
-            # Join speed to car records
-            df = df.merge(
-                speed_daily[["sensor_id", "date", "p85_speed"]],
-                on=["sensor_id", "date"],
-                how="left"
-            )
-            
-            # Only apply v85 to car mode
-            df.loc[df["mode"] == "car", "v85"] = df.loc[df["mode"] == "car", "p85_speed"]
-            df = df.drop(columns=["date", "p85_speed"])
-        
-        return df
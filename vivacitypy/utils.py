@@ -1,5 +1,35 @@
 import re
+from functools import lru_cache
 
+# Patterns are compiled once at import; these helpers run once per sensor name
+_CAMEL_SPLIT = re.compile(r'([a-z])([A-Z])')
+_NUM_UPPER = re.compile(r'(\d)([A-Z])')
+_CAM_PREFIX = re.compile(r'^[Ss]\d+$')
+_TRAIL_DIR = re.compile(r'[nsew]$')
+
+# Common road type abbreviations, expanded only at the END of a name
+_ROAD_TYPE_ABBREVS = {
+    'st': 'Street',
+    'ln': 'Lane',
+    'rd': 'Road',
+    'ave': 'Avenue',
+    'dr': 'Drive',
+    'ct': 'Court',
+    'pl': 'Place',
+    'cres': 'Crescent',
+    'cr': 'Crescent',
+    'gr': 'Grove',
+    'pk': 'Park',
+    'sq': 'Square',
+    'terr': 'Terrace',
+    'jnt': 'Junction',
+    'way': 'Way',
+}
+
+
+# format_road_name and extract_camera_id are memoized per process: a batch
+# import sees a few hundred distinct sensor names repeated across every row
+@lru_cache(maxsize=4096)
 def format_road_name(camel_case: str) -> str:
     """Convert CamelCase road name to properly spaced and capitalized format.
     
@@ -20,45 +50,27 @@ def format_road_name(camel_case: str) -> str:
         return camel_case
     
     # Insert spaces before capital letters (but not at start)
-    result = re.sub(r'([a-z])([A-Z])', r'\1 \2', camel_case)
+    result = _CAMEL_SPLIT.sub(r'\1 \2', camel_case)
     
     # Also handle lowercase to uppercase transitions after numbers
-    result = re.sub(r'(\d)([A-Z])', r'\1 \2', result)
+    result = _NUM_UPPER.sub(r'\1 \2', result)
     
     # Split into words for processing
     words = result.split()
     
     # Only expand abbreviations at the END of the name (last word)
-    # Common road type abbreviations
-    road_type_abbrevs = {
-        'st': 'Street',
-        'ln': 'Lane',
-        'rd': 'Road',
-        'ave': 'Avenue',
-        'dr': 'Drive',
-        'ct': 'Court',
-        'pl': 'Place',
-        'cres': 'Crescent',
-        'cr': 'Crescent',
-        'gr': 'Grove',
-        'pk': 'Park',
-        'sq': 'Square',
-        'terr': 'Terrace',
-        'jnt': 'Junction',
-        'way': 'Way',
-    }
-    
     if words:
         last_word = words[-1].lower()
-        if last_word in road_type_abbrevs:
-            words[-1] = road_type_abbrevs[last_word]
+        if last_word in _ROAD_TYPE_ABBREVS:
+            words[-1] = _ROAD_TYPE_ABBREVS[last_word]
     
-    # Title case each word
-    result = ' '.join(word.capitalize() for word in words)
+    # Title case each word (not str.title(), which would give '61St' and "O'Brien")
+    result = ' '.join(map(str.capitalize, words))
     
     return result
 
 
+@lru_cache(maxsize=4096)
 def extract_camera_id(sensor_name: str) -> tuple[str, str, str, str]:
     """Extract camera_id, cordon_name, road_name, and counter_type from Vivacity sensor name.
     
@@ -92,7 +104,7 @@ def extract_camera_id(sensor_name: str) -> tuple[str, str, str, str]:
     # 2. Extract camera prefix (e.g. S31_, S40_)
     # This prefix uniquely identifies the camera installation
     parts = sensor_name.split('_', 1)
-    if len(parts) == 2 and re.match(r'^[Ss]\d+$', parts[0]):
+    if len(parts) == 2 and _CAM_PREFIX.match(parts[0]):
         cordon_name = parts[0].upper()
         name_body = parts[1]
     else:
@@ -113,7 +125,7 @@ def extract_camera_id(sensor_name: str) -> tuple[str, str, str, str]:
     location_id = raw_road_name.lower() if raw_road_name else ''
     
     # Strip trailing compass directions from location_id (e.g., HunsletRdS -> hunsletrd)
-    location_id = re.sub(r'[nsew]$', '', location_id)
+    location_id = _TRAIL_DIR.sub('', location_id)
     
     # 5. Combine camera prefix with location to create unique camera_id
     # All cordons from the same camera (e.g., S40_WoodhouseLn_road, S40_WoodhouseLn_pathLHS)